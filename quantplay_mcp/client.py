@@ -4,18 +4,34 @@ QuantPlay API client implementation.
 This module provides a client for interacting with the QuantPlay API,
 handling authentication, request construction, and response parsing.
 """
+import asyncio
+import functools
+import inspect
 import json
 import logging
-from typing import List, Optional, TypeVar, Type
+import os
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, TypeVar
 
 import requests
 import aiohttp
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as URLLib3HTTPError, ReadTimeoutError
+from urllib3.util.retry import Retry
 from aiohttp import ClientSession, ClientResponse, ClientTimeout
 
 from quantplay_mcp.config import (
     API_ENDPOINT,
     DEFAULT_HEADERS,
     DEFAULT_TIMEOUT,
+    DEFAULT_CONNECT_TIMEOUT,
+    ASYNC_CONNECTION_LIMIT,
+    ASYNC_CONNECTION_LIMIT_PER_HOST,
+    ACCOUNTS_CACHE_TTL,
+    HOLDINGS_CACHE_TTL,
+    POSITIONS_CACHE_TTL,
+    NEGATIVE_CACHE_TTL,
+    NEGATIVE_CACHE_MAXSIZE,
     ACCOUNTS_ENDPOINT,
     POSITIONS_ENDPOINT,
     HOLDINGS_ENDPOINT,
@@ -23,16 +39,31 @@ from quantplay_mcp.config import (
     ERROR_API_REQUEST_FAILED,
     ERROR_NETWORK_ERROR,
     ERROR_TIMEOUT,
+    ERROR_CONNECT_TIMEOUT,
     ERROR_PARSE_ERROR, PLACE_ORDER_ENDPOINT,
 )
-from quantplay_mcp.models import Account, APIResponse
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+    _JSON_DECODE_ERRORS = (orjson.JSONDecodeError, json.JSONDecodeError)
+except ImportError:  # orjson is optional, fall back to the stdlib parser
+    _json_loads = json.loads
+    _JSON_DECODE_ERRORS = (json.JSONDecodeError,)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
 # Type variables
 T = TypeVar('T')
-ResponseType = TypeVar('ResponseType', bound=APIResponse)
+
+# Sentinel distinguishing a cache miss from a cached falsy value
+_MISSING = object()
 
 
 class QuantPlayAPIError(Exception):
@@ -71,6 +102,74 @@ class ParseError(QuantPlayAPIError):
     pass
 
 
+class _TTLCache:
+    """Minimal in-memory cache whose entries expire after a per-entry lifetime."""
+
+    def __init__(self, maxsize: Optional[int] = None):
+        self.maxsize = maxsize
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the live value for key, or default if it is absent or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        expiry, value = entry
+        if expiry <= time.monotonic():
+            self._entries.pop(key, None)
+            return default
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Store value under key for ttl seconds, evicting the oldest entry when full."""
+        if (
+                self.maxsize is not None and
+                key not in self._entries and
+                len(self._entries) >= self.maxsize
+        ):
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (time.monotonic() + ttl, value)
+
+    def pop(self, key: Hashable) -> None:
+        """Remove key if present."""
+        self._entries.pop(key, None)
+
+    def keys(self) -> List[Hashable]:
+        """Return a snapshot of the stored keys, including expired ones."""
+        return list(self._entries)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._entries.clear()
+
+
+def ttl_cached(ttl: float) -> Callable:
+    """
+    Cache a client method's result for ttl seconds.
+
+    Results are stored on the instance's ``_cache`` keyed by the method name
+    and its bound arguments, e.g. ``("get_positions", nickname)``, whether they
+    were passed positionally or by keyword. List results are returned as a
+    shallow copy, so callers can't change what later calls see by appending
+    to or removing from the list.
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            key = (func.__name__, *bound.args[1:])
+            result = self._cache.get(key, _MISSING)
+            if result is _MISSING:
+                result = func(*bound.args, **bound.kwargs)
+                self._cache.set(key, result, ttl)
+            return list(result) if isinstance(result, list) else result
+        return wrapper
+    return decorator
+
+
 class QuantPlayClient:
     """
     Client for the QuantPlay API.
@@ -84,6 +183,7 @@ class QuantPlayClient:
             api_key: str,
             base_url: str = API_ENDPOINT,
             timeout: int = DEFAULT_TIMEOUT,
+            connect_timeout: int = DEFAULT_CONNECT_TIMEOUT,
     ):
         """
         Initialize the QuantPlay API client.
@@ -91,7 +191,8 @@ class QuantPlayClient:
         Args:
             api_key: API key for authentication
             base_url: Base URL for the API (default from config)
-            timeout: Request timeout in seconds (default from config)
+            timeout: Read timeout in seconds (default from config)
+            connect_timeout: Connection timeout in seconds (default from config)
         
         Raises:
             AuthenticationError: If the API key is empty or invalid
@@ -102,13 +203,148 @@ class QuantPlayClient:
         self.api_key = api_key
         self.base_url = base_url
         self.timeout = timeout
-
-        # Set up headers with authentication
-        self.headers = DEFAULT_HEADERS.copy()
-        self.headers["x-api-key"] = api_key
+        self.connect_timeout = connect_timeout
+
+        # Precompute endpoint URLs; the templated ones only need the nickname filled in
+        self._accounts_url = self._build_url(ACCOUNTS_ENDPOINT)
+        self._holdings_url_fmt = self._build_url(HOLDINGS_ENDPOINT)
+        self._positions_url_fmt = self._build_url(POSITIONS_ENDPOINT)
+        self._place_order_url_fmt = self._build_url(PLACE_ORDER_ENDPOINT)
+
+        # Reuse one pooled session so sequential calls share a keep-alive connection
+        self._session = requests.Session()
+        self._session.headers.update(DEFAULT_HEADERS)
+        self._session.headers["x-api-key"] = api_key
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                connect=2,
+                read=2,
+                backoff_factor=0.3,
+                status_forcelist=[502, 503, 504],
+                # Orders are not idempotent, so a POST is never retried
+                allowed_methods=frozenset(["GET"]),
+                raise_on_status=False,
+            ),
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        # Resolve proxy and CA bundle settings from the environment once, instead
+        # of letting requests re-read them (and ~/.netrc) on every call
+        self._session.proxies.update(requests.utils.get_environ_proxies(base_url))
+        self._session.verify = (
+            os.environ.get("REQUESTS_CA_BUNDLE")
+            or os.environ.get("CURL_CA_BUNDLE")
+            or True
+        )
+        self._session.trust_env = False
+
+        # Short-lived cache of read-only responses, see ttl_cached
+        self._cache = _TTLCache()
+
+        # Recent 4xx failures per GET URL, so repeated bad lookups skip the network
+        self._negative_cache = _TTLCache(maxsize=NEGATIVE_CACHE_MAXSIZE)
+
+        # Shared aiohttp session for the async methods, created on first use
+        self._aio_session: Optional[ClientSession] = None
 
         logger.debug(f"Initialized QuantPlay API client with base URL: {base_url}")
 
+    def close(self) -> None:
+        """
+        Close the sync HTTP session and release its pooled connections.
+
+        The aiohttp session used by the async methods must be closed
+        separately with ``await aclose()``, or by using the client as an
+        async context manager, which closes both.
+        """
+        self._session.close()
+
+    def __enter__(self) -> "QuantPlayClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "QuantPlayClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+        await self.aclose()
+
+    async def _get_session(self) -> ClientSession:
+        """
+        Get the shared aiohttp session, creating it on first use.
+
+        Returns:
+            An open ClientSession bound to the running event loop
+        """
+        if self._aio_session is None or self._aio_session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=ASYNC_CONNECTION_LIMIT,
+                limit_per_host=ASYNC_CONNECTION_LIMIT_PER_HOST,
+            )
+            self._aio_session = aiohttp.ClientSession(
+                connector=connector,
+                # sock_connect bounds only the handshake; aiohttp's ``connect``
+                # would also count waiting for a free pooled connection
+                timeout=ClientTimeout(
+                    total=None,
+                    connect=None,
+                    sock_connect=self.connect_timeout,
+                    sock_read=self.timeout,
+                ),
+                headers={**DEFAULT_HEADERS, "x-api-key": self.api_key},
+            )
+        return self._aio_session
+
+    async def aclose(self) -> None:
+        """Close the shared aiohttp session, if one was created."""
+        # Detach first so calls made while closing get a fresh session
+        session, self._aio_session = self._aio_session, None
+        if session is not None:
+            await session.close()
+
+    def invalidate(self, nickname: Optional[str] = None) -> None:
+        """
+        Drop cached holdings and positions, including remembered 4xx failures.
+
+        Args:
+            nickname: Only drop entries for this account (default: all accounts)
+        """
+        for key in self._cache.keys():
+            if key[0] not in ("get_holdings", "get_positions"):
+                continue
+            if nickname is None or key[1:] == (nickname,):
+                self._cache.pop(key)
+
+        if nickname is None:
+            self._negative_cache.clear()
+        else:
+            self._negative_cache.pop(self._holdings_url_fmt.format(nickname))
+            self._negative_cache.pop(self._positions_url_fmt.format(nickname))
+
+    def _check_negative_cache(self, url: str) -> None:
+        """
+        Re-raise a recent client error for url without touching the network.
+
+        Raises:
+            APIRequestError: If url failed with a 4xx status within NEGATIVE_CACHE_TTL
+        """
+        failure = self._negative_cache.get(url)
+        if failure is not None:
+            logger.debug("Negative cache hit for %s", url)
+            raise APIRequestError(*failure)
+
+    def _remember_failure(self, url: str, error: APIRequestError) -> None:
+        """Negative-cache a 4xx error for url; rate limits and timeouts are left retryable."""
+        if 400 <= error.status_code < 500 and error.status_code not in (408, 429):
+            self._negative_cache.set(url, (error.status_code, error.message), NEGATIVE_CACHE_TTL)
+
     def _build_url(self, endpoint: str) -> str:
         """
         Build a full URL for an API endpoint.
@@ -127,18 +363,19 @@ class QuantPlayClient:
 
     def _handle_response(
             self,
-            response: requests.Response
-    ) -> ResponseType:
+            response: requests.Response,
+            body: bytes
+    ) -> Any:
         """
         Handle an API response, checking for errors and parsing the response.
 
 
         Args:
             response: The requests.Response object
-            response_class: The class to parse the response into
+            body: The already-read, decoded response body
         
         Returns:
-            Parsed response object
+            The "data" field of the response payload
         
         Raises:
             APIRequestError: If the API returns an error
@@ -146,7 +383,7 @@ class QuantPlayClient:
         """
         try:
             response.raise_for_status()
-            response_data = response.json()
+            response_data = _json_loads(body)
 
             # Check if response has error status
             if (
@@ -163,32 +400,32 @@ class QuantPlayClient:
             # Try to extract error message from response
             error_message = "Unknown error"
             try:
-                error_data = response.json()
+                error_data = _json_loads(body)
                 if isinstance(error_data, dict):
                     error_message = error_data.get("message", "Unknown error")
             except:
-                error_message = response.text or "Unknown error"
+                error_message = body.decode(errors="replace") or "Unknown error"
 
             raise APIRequestError(response.status_code, error_message) from e
 
-        except json.JSONDecodeError as e:
+        except _JSON_DECODE_ERRORS as e:
             logger.error(f"Failed to parse response: {e}")
             raise ParseError(ERROR_PARSE_ERROR.format(error=str(e))) from e
 
     async def _handle_async_response(
             self,
-            response: ClientResponse,
-            response_class: Type[ResponseType]
-    ) -> ResponseType:
+            response: ClientResponse
+    ) -> Any:
         """
         Handle an async API response, checking for errors and parsing the response.
         
+        Mirrors _handle_response so the sync and async methods return the same data.
+
         Args:
             response: The aiohttp ClientResponse object
-            response_class: The class to parse the response into
         
         Returns:
-            Parsed response object
+            The "data" field of the response payload
         
         Raises:
             APIRequestError: If the API returns an error
@@ -198,7 +435,7 @@ class QuantPlayClient:
             if not response.ok:
                 error_message = "Unknown error"
                 try:
-                    error_data = await response.json()
+                    error_data = _json_loads(await response.read())
                     if isinstance(error_data, dict):
                         error_message = error_data.get("message", "Unknown error")
                 except:
@@ -206,30 +443,38 @@ class QuantPlayClient:
 
                 raise APIRequestError(response.status, error_message)
 
-            response_data = await response.json()
+            response_data = _json_loads(await response.read())
 
             # Check if response has error status
             if (
                     isinstance(response_data, dict) and
-                    response_data.get("status") == "error"
+                    response_data.get("error") == True
             ):
                 raise APIRequestError(
                     response.status,
                     response_data.get("message", "Unknown error")
                 )
 
-            return response_class.from_dict(response_data)
+            return response_data["data"]
 
-        except json.JSONDecodeError as e:
+        except _JSON_DECODE_ERRORS as e:
             logger.error(f"Failed to parse response: {e}")
             raise ParseError(ERROR_PARSE_ERROR.format(error=str(e))) from e
 
-    def place_order(self, order):
+    def _request(self, method: str, url: str, **kwargs) -> Any:
         """
-        Place order
+        Perform a request over the shared session.
+
+        GET requests that recently failed with a client error are answered
+        from the negative cache instead of being sent again.
+
+        Args:
+            method: The HTTP method (e.g., "GET")
+            url: The full URL to request
+            **kwargs: Extra arguments passed through to requests
 
         Returns:
-            the order id
+            The "data" field of the response payload
 
         Raises:
             APIRequestError: If the API returns an error
@@ -237,80 +482,115 @@ class QuantPlayClient:
             TimeoutError: If the request times out
             ParseError: If response parsing fails
         """
-        url = self._build_url(PLACE_ORDER_ENDPOINT.format(order["nickname"]))
+        is_get = method == "GET"
+        if is_get:
+            self._check_negative_cache(url)
 
-        try:
+        logger.debug("%s %s", method, url)
 
-            response = requests.post(
-                url,
-                headers=self.headers,
-                json=order,
-                timeout=self.timeout,
-            )
+        try:
+            # Stream the body and read it in one call rather than letting requests
+            # collect it in chunks and join them, which doubles peak memory
+            with self._session.request(
+                    method,
+                    url,
+                    timeout=(self.connect_timeout, self.timeout),
+                    stream=True,
+                    **kwargs
+            ) as response:
+                body = response.raw.read(decode_content=True)
+                return self._handle_response(response, body)
+
+        except APIRequestError as e:
+            if is_get:
+                self._remember_failure(url, e)
+            raise
 
-            response = self._handle_response(response)
-            return response
+        except requests.exceptions.ConnectTimeout as e:
+            logger.error(f"Connection timed out: {e}")
+            raise TimeoutError(ERROR_CONNECT_TIMEOUT.format(timeout=self.connect_timeout)) from e
 
         except requests.exceptions.Timeout as e:
             logger.error(f"Request timed out: {e}")
             raise TimeoutError(ERROR_TIMEOUT.format(timeout=self.timeout)) from e
 
         except requests.exceptions.ConnectionError as e:
+            # Once the adapter's read retries run out, requests reports the read
+            # timeout as a ConnectionError wrapping urllib3's MaxRetryError
+            reason = getattr(e.args[0], "reason", None) if e.args else None
+            if isinstance(reason, ReadTimeoutError):
+                logger.error(f"Request timed out: {e}")
+                raise TimeoutError(ERROR_TIMEOUT.format(timeout=self.timeout)) from e
+
             logger.error(f"Network error: {e}")
             raise NetworkError(ERROR_NETWORK_ERROR.format(error=str(e))) from e
 
-        except (requests.exceptions.RequestException, QuantPlayAPIError) as e:
-            if not isinstance(e, QuantPlayAPIError):
-                logger.error(f"Request failed: {e}")
-                raise NetworkError(ERROR_NETWORK_ERROR.format(error=str(e))) from e
-            raise
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Request failed: {e}")
+            raise NetworkError(ERROR_NETWORK_ERROR.format(error=str(e))) from e
+
+        # Reading the raw stream surfaces urllib3's exceptions unwrapped
+        except ReadTimeoutError as e:
+            logger.error(f"Request timed out: {e}")
+            raise TimeoutError(ERROR_TIMEOUT.format(timeout=self.timeout)) from e
+
+        except URLLib3HTTPError as e:
+            logger.error(f"Network error: {e}")
+            raise NetworkError(ERROR_NETWORK_ERROR.format(error=str(e))) from e
 
-    def get_accounts(self) -> List[Account]:
+    def place_order(self, order: Dict[str, Any]) -> Any:
         """
-        Get all accounts from the API.
-        
+        Place order
+
+        Args:
+            order: The order fields, including the account "nickname"
+
         Returns:
-            List of Account objects
-        
+            The "data" field of the API response, i.e. the order id
+
         Raises:
             APIRequestError: If the API returns an error
             NetworkError: If a network error occurs
             TimeoutError: If the request times out
             ParseError: If response parsing fails
         """
-        url = self._build_url(ACCOUNTS_ENDPOINT)
-
         try:
-
-            response = requests.get(
-                url,
-                headers=self.headers,
-                timeout=self.timeout,
+            return self._request(
+                "POST",
+                self._place_order_url_fmt.format(order["nickname"]),
+                # Pre-encoded body; Content-Type is already set on the session
+                data=_json_dumps(order),
             )
+        finally:
+            # The order may have gone through even if the response was lost
+            self.invalidate(order["nickname"])
 
-            accounts_response = self._handle_response(response)
-            return accounts_response
-
-        except requests.exceptions.Timeout as e:
-            logger.error(f"Request timed out: {e}")
-            raise TimeoutError(ERROR_TIMEOUT.format(timeout=self.timeout)) from e
-
-        except requests.exceptions.ConnectionError as e:
-            logger.error(f"Network error: {e}")
-            raise NetworkError(ERROR_NETWORK_ERROR.format(error=str(e))) from e
-
-        except (requests.exceptions.RequestException, QuantPlayAPIError) as e:
-            if not isinstance(e, QuantPlayAPIError):
-                logger.error(f"Request failed: {e}")
-                raise NetworkError(ERROR_NETWORK_ERROR.format(error=str(e))) from e
-            raise
+    @ttl_cached(ACCOUNTS_CACHE_TTL)
+    def get_accounts(self) -> List[dict]:
+        """
+        Get all accounts from the API.
+        
+        Returns:
+            List of account dictionaries, as returned by the API
+        
+        Raises:
+            APIRequestError: If the API returns an error
+            NetworkError: If a network error occurs
+            TimeoutError: If the request times out
+            ParseError: If response parsing fails
+        """
+        return self._request("GET", self._accounts_url)
 
+    @ttl_cached(HOLDINGS_CACHE_TTL)
     def get_holdings(self, nickname) -> List[dict]:
         """
-        Get all accounts from the API.
+        Get holdings for an account from the API.
+
+        Args:
+            nickname: The account nickname
 
         Returns:
-            List of Account objects
+            List of holdings dictionaries
 
         Raises:
             APIRequestError: If the API returns an error
@@ -318,40 +598,36 @@ class QuantPlayClient:
             TimeoutError: If the request times out
             ParseError: If response parsing fails
         """
-        url = self._build_url(HOLDINGS_ENDPOINT.format(nickname))
-        print(url)
+        return self._request("GET", self._holdings_url_fmt.format(nickname))
 
-        try:
-
-            response = requests.get(
-                url,
-                headers=self.headers,
-                timeout=self.timeout,
-            )
-
-            positions_response = self._handle_response(response)
-            return positions_response
+    @ttl_cached(POSITIONS_CACHE_TTL)
+    def get_positions(self, nickname) -> List[dict]:
+        """
+        Get positions for an account from the API.
 
-        except requests.exceptions.Timeout as e:
-            logger.error(f"Request timed out: {e}")
-            raise TimeoutError(ERROR_TIMEOUT.format(timeout=self.timeout)) from e
+        Args:
+            nickname: The account nickname
 
-        except requests.exceptions.ConnectionError as e:
-            logger.error(f"Network error: {e}")
-            raise NetworkError(ERROR_NETWORK_ERROR.format(error=str(e))) from e
+        Returns:
+            List of position dictionaries
 
-        except (requests.exceptions.RequestException, QuantPlayAPIError) as e:
-            if not isinstance(e, QuantPlayAPIError):
-                logger.error(f"Request failed: {e}")
-                raise NetworkError(ERROR_NETWORK_ERROR.format(error=str(e))) from e
-            raise
+        Raises:
+            APIRequestError: If the API returns an error
+            NetworkError: If a network error occurs
+            TimeoutError: If the request times out
+            ParseError: If response parsing fails
+        """
+        return self._request("GET", self._positions_url_fmt.format(nickname))
 
-    def get_positions(self, nickname) -> List[dict]:
+    async def _async_get(self, url: str) -> Any:
         """
-        Get all accounts from the API.
+        Perform a GET request over the shared aiohttp session.
+
+        Args:
+            url: The full URL to fetch
 
         Returns:
-            List of Account objects
+            The "data" field of the response payload
 
         Raises:
             APIRequestError: If the API returns an error
@@ -359,43 +635,41 @@ class QuantPlayClient:
             TimeoutError: If the request times out
             ParseError: If response parsing fails
         """
-        url = self._build_url(POSITIONS_ENDPOINT.format(nickname))
-        print(url)
+        self._check_negative_cache(url)
+        session = await self._get_session()
 
         try:
+            async with session.get(url) as response:
+                return await self._handle_async_response(response)
 
-            response = requests.get(
-                url,
-                headers=self.headers,
-                timeout=self.timeout,
-            )
+        except APIRequestError as e:
+            self._remember_failure(url, e)
+            raise
 
-            positions_response = self._handle_response(response)
-            return positions_response
+        except aiohttp.ConnectionTimeoutError as e:
+            logger.error(f"Async connection timed out: {e}")
+            raise TimeoutError(ERROR_CONNECT_TIMEOUT.format(timeout=self.connect_timeout)) from e
 
-        except requests.exceptions.Timeout as e:
-            logger.error(f"Request timed out: {e}")
+        except asyncio.TimeoutError as e:
+            logger.error(f"Async request timed out: {e}")
             raise TimeoutError(ERROR_TIMEOUT.format(timeout=self.timeout)) from e
 
-        except requests.exceptions.ConnectionError as e:
-            logger.error(f"Network error: {e}")
+        except aiohttp.ClientConnectorError as e:
+            logger.error(f"Async network error: {e}")
             raise NetworkError(ERROR_NETWORK_ERROR.format(error=str(e))) from e
 
-        except (requests.exceptions.RequestException, QuantPlayAPIError) as e:
+        except (aiohttp.ClientError, QuantPlayAPIError) as e:
             if not isinstance(e, QuantPlayAPIError):
-                logger.error(f"Request failed: {e}")
+                logger.error(f"Async request failed: {e}")
                 raise NetworkError(ERROR_NETWORK_ERROR.format(error=str(e))) from e
             raise
 
-    async def async_get_accounts(self, session: Optional[ClientSession] = None) -> List[Account]:
+    async def async_get_accounts(self) -> List[dict]:
         """
         Get all accounts from the API asynchronously.
         
-        Args:
-            session: Optional existing aiohttp ClientSession
-        
         Returns:
-            List of Account objects
+            List of account dictionaries, as returned by the API
         
         Raises:
             APIRequestError: If the API returns an error
@@ -403,37 +677,72 @@ class QuantPlayClient:
             TimeoutError: If the request times out
             ParseError: If response parsing fails
         """
-        url = self._build_url(ACCOUNTS_ENDPOINT)
-        client_timeout = ClientTimeout(total=self.timeout)
+        return await self._async_get(self._accounts_url)
 
-        # Create a new session if one wasn't provided
-        should_close_session = session is None
-        if session is None:
-            session = aiohttp.ClientSession(timeout=client_timeout)
+    async def async_get_holdings(self, nickname: str) -> List[dict]:
+        """
+        Get holdings for an account from the API asynchronously.
 
-        try:
-            async with session.get(url, headers=self.headers) as response:
-                accounts_response = await self._handle_async_response(response, AccountsResponse)
-                return accounts_response.data
+        Args:
+            nickname: The account nickname
 
-        except asyncio.TimeoutError as e:
-            logger.error(f"Async request timed out: {e}")
-            raise TimeoutError(ERROR_TIMEOUT.format(timeout=self.timeout)) from e
+        Returns:
+            List of holdings dictionaries
 
-        except aiohttp.ClientConnectorError as e:
-            logger.error(f"Async network error: {e}")
-            raise NetworkError(ERROR_NETWORK_ERROR.format(error=str(e))) from e
+        Raises:
+            APIRequestError: If the API returns an error
+            NetworkError: If a network error occurs
+            TimeoutError: If the request times out
+            ParseError: If response parsing fails
+        """
+        return await self._async_get(self._holdings_url_fmt.format(nickname))
 
-        except (aiohttp.ClientError, QuantPlayAPIError) as e:
-            if not isinstance(e, QuantPlayAPIError):
-                logger.error(f"Async request failed: {e}")
-                raise NetworkError(ERROR_NETWORK_ERROR.format(error=str(e))) from e
-            raise
+    async def async_get_positions(self, nickname: str) -> List[dict]:
+        """
+        Get positions for an account from the API asynchronously.
 
-        finally:
-            # Close the session if we created it
-            if should_close_session and session is not None:
-                await session.close()
+        Args:
+            nickname: The account nickname
+
+        Returns:
+            List of position dictionaries
+
+        Raises:
+            APIRequestError: If the API returns an error
+            NetworkError: If a network error occurs
+            TimeoutError: If the request times out
+            ParseError: If response parsing fails
+        """
+        return await self._async_get(self._positions_url_fmt.format(nickname))
+
+    async def get_all_positions(self, nicknames: List[str]) -> Dict[str, Any]:
+        """
+        Get positions for several accounts concurrently.
+
+        One account failing does not fail the others; its entry holds the
+        error message instead.
+
+        Args:
+            nicknames: The account nicknames to fetch
+
+        Returns:
+            Mapping of nickname to its list of positions, or to
+            ``{"error": message}`` if that account's request failed
+        """
+        results = await asyncio.gather(
+            *(self.async_get_positions(nickname) for nickname in nicknames),
+            return_exceptions=True,
+        )
+
+        all_positions: Dict[str, Any] = {}
+        for nickname, result in zip(nicknames, results):
+            if isinstance(result, QuantPlayAPIError):
+                all_positions[nickname] = {"error": str(result)}
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                all_positions[nickname] = result
+        return all_positions
 
 
 # For backward compatibility and convenience
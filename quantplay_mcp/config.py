@@ -2,7 +2,8 @@
 Configuration module for QuantPlay API client.
 Contains constants and settings used throughout the client.
 """
-from typing import Dict
+from types import MappingProxyType
+from typing import Mapping
 
 # API Base URL
 API_BASE_URL: str = "https://dms.quantplay.tech"
@@ -10,11 +11,21 @@ API_VERSION: str = "v2"
 API_ENDPOINT: str = f"{API_BASE_URL}/{API_VERSION}"
 
 # Request configuration
-DEFAULT_TIMEOUT: int = 30  # seconds
-DEFAULT_HEADERS: Dict[str, str] = {
+DEFAULT_TIMEOUT: int = 30  # seconds, per socket read
+DEFAULT_CONNECT_TIMEOUT: int = 5  # seconds
+ASYNC_CONNECTION_LIMIT: int = 100
+ASYNC_CONNECTION_LIMIT_PER_HOST: int = 10
+DEFAULT_HEADERS: Mapping[str, str] = MappingProxyType({
     "Content-Type": "application/json",
     "Accept": "application/json",
-}
+})
+
+# Response cache lifetimes
+ACCOUNTS_CACHE_TTL: float = 60.0  # seconds
+HOLDINGS_CACHE_TTL: float = 60.0  # seconds
+POSITIONS_CACHE_TTL: float = 5.0  # seconds
+NEGATIVE_CACHE_TTL: float = 30.0  # seconds
+NEGATIVE_CACHE_MAXSIZE: int = 128
 
 # Endpoints
 ACCOUNTS_ENDPOINT: str = "/accounts"
@@ -26,6 +37,7 @@ PLACE_ORDER_ENDPOINT: str = "/execution/order/place?nickname={}"
 ERROR_INVALID_API_KEY: str = "Invalid API key provided"
 ERROR_API_REQUEST_FAILED: str = "API request failed: {status_code} - {message}"
 ERROR_NETWORK_ERROR: str = "Network error occurred while connecting to QuantPlay API: {error}"
-ERROR_TIMEOUT: str = "Request to QuantPlay API timed out after {timeout} seconds"
+ERROR_TIMEOUT: str = "Request to QuantPlay API timed out: no data received for {timeout} seconds"
+ERROR_CONNECT_TIMEOUT: str = "Connecting to QuantPlay API timed out after {timeout} seconds"
 ERROR_PARSE_ERROR: str = "Failed to parse API response: {error}"
 
@@ -2,38 +2,64 @@
 Data models for the QuantPlay API client.
 Defines the structure of API responses and requests.
 """
-from dataclasses import dataclass, asdict
-from typing import Dict, List, Optional, Any, Type, TypeVar
+from dataclasses import dataclass, fields
+from typing import Dict, FrozenSet, List, Optional, Any, Tuple, Type, TypeVar
 
 
 T = TypeVar('T', bound='BaseModel')
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseModel:
     """Base model with common functionality for all models."""
+
+    @classmethod
+    def _field_names(cls) -> Tuple[Tuple[str, ...], FrozenSet[str]]:
+        """
+        Return the field names as an ordered tuple and as a frozenset.
+
+        Computed once per class on first use; ``__init_subclass__`` runs
+        before ``@dataclass`` has collected the fields, so it can't be done there.
+        """
+        cached = cls.__dict__.get("_field_names_cache")
+        if cached is None:
+            names = tuple(f.name for f in fields(cls))
+            cached = (names, frozenset(names))
+            cls._field_names_cache = cached
+        return cached
     
     @classmethod
     def from_dict(cls: Type[T], data: Dict[str, Any]) -> T:
         """Create an instance from a dictionary."""
         # Filter out keys that are not fields in the dataclass
-        field_names = {f.name for f in cls.__dataclass_fields__.values()}  # type: ignore
-        filtered_data = {k: v for k, v in data.items() if k in field_names}
-        return cls(**filtered_data)
+        _, field_names = cls._field_names()
+        return cls(**{k: data[k] for k in data.keys() & field_names})
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert instance to a dictionary."""
-        return asdict(self)
+        """Convert instance to a (shallow) dictionary."""
+        field_names, _ = self._field_names()
+        return {name: getattr(self, name) for name in field_names}
     
     @classmethod
     def from_json_list(cls: Type[T], json_data: List[Dict[str, Any]]) -> List[T]:
         """Create a list of instances from a JSON array."""
         return [cls.from_dict(item) for item in json_data]
 
+    @classmethod
+    def from_json_list_fast(cls: Type[T], rows: List[Dict[str, Any]]) -> List[T]:
+        """
+        Create a list of instances from a JSON array of same-shaped rows.
+
+        Skips the per-row from_dict dispatch and walks the class's fields
+        directly, which is cheaper when rows carry many extra keys.
+        """
+        field_names, _ = cls._field_names()
+        return [cls(**{k: row[k] for k in field_names if k in row}) for row in rows]
+
 
 
 
-@dataclass
+@dataclass(slots=True)
 class Account(BaseModel):
     """Trading account information."""
     broker: str
@@ -41,21 +67,8 @@ class Account(BaseModel):
     nickname: str
     expiry: str
 
-    
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'Account':
-        """Create an Account instance from a dictionary with nested objects."""
-        account_data = data.copy()
-
-        
-        # Filter out keys that are not fields in the dataclass
-        field_names = {f.name for f in cls.__dataclass_fields__.values()}  # type: ignore
-        filtered_data = {k: v for k, v in account_data.items() if k in field_names}
-        
-        return cls(**filtered_data)
-
 
-@dataclass
+@dataclass(slots=True)
 class APIResponse(BaseModel):
     """Generic API response model."""
     status: str
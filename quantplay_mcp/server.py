@@ -1,32 +1,58 @@
-from typing import Literal
+import asyncio
+import sys
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import AsyncIterator, Literal
 
 from mcp.server.fastmcp import FastMCP
 from dotenv import load_dotenv
 import os
 from quantplay_mcp.client import QuantPlayClient
-from quantplay_mcp.models import Account
-import requests
 
 # Create an MCP server
 load_dotenv()
-api_key = os.getenv("QUANTPLAY_API_KEY")
 
-if not api_key:
-    raise ValueError("QUANTPLAY_API_KEY environment variable is required")
 
-quantplay_client = QuantPlayClient(api_key=api_key)
-mcp = FastMCP("Quantplay")
+@lru_cache(maxsize=1)
+def get_client() -> QuantPlayClient:
+    """Return the shared QuantPlay client, creating it on first use."""
+    api_key = os.getenv("QUANTPLAY_API_KEY")
+
+    if not api_key:
+        raise ValueError("QUANTPLAY_API_KEY environment variable is required")
+
+    return QuantPlayClient(api_key=api_key)
+
+
+# Number of open client connections; lifespan is entered once per connection
+_active_connections = 0
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Close the client's async connection pool once the last connection ends."""
+    global _active_connections
+    _active_connections += 1
+    try:
+        yield
+    finally:
+        _active_connections -= 1
+        if _active_connections == 0 and get_client.cache_info().currsize:
+            await get_client().aclose()
+
+
+mcp = FastMCP("Quantplay", lifespan=lifespan)
 
 
 # Add a tool to get positions by nickname
 @mcp.tool()
-def get_accounts() -> list[Account]:
+def get_accounts() -> list[dict]:
     """Get all broker Accounts for the user
 
     Returns:
         A list of account dictionaries
     """
-    return quantplay_client.get_accounts()
+    return get_client().get_accounts()
 
 # Add a tool to get positions by nickname
 @mcp.tool()
@@ -42,7 +68,7 @@ def get_positions(nickname: str) -> list[dict]:
     # Implementation needed here
     # For example:
 
-    return quantplay_client.get_positions(nickname)
+    return get_client().get_positions(nickname)
 
 # Add a tool to get holdings by nickname
 @mcp.tool()
@@ -58,7 +84,21 @@ def get_holdings(nickname: str) -> list[dict]:
     # Implementation needed here
     # For example:
 
-    return quantplay_client.get_holdings(nickname)
+    return get_client().get_holdings(nickname)
+
+# Add a tool to get positions across every account
+@mcp.tool()
+async def get_all_positions() -> dict:
+    """Get positions for every broker Account of the user
+
+    Returns:
+        A dictionary mapping each account nickname to its list of positions,
+        or to an error message if that account could not be fetched
+    """
+    client = get_client()
+    accounts = await client.async_get_accounts()
+
+    return await client.get_all_positions([account["nickname"] for account in accounts])
 
 @mcp.tool()
 def place_order(
@@ -87,7 +127,7 @@ def place_order(
         tag: Custom tag for tracking.
 
     Returns:
-        The API response as a dictionary.
+        A dictionary with the placed order's id under "order_id".
     """
     order = {
         "nickname": nickname,
@@ -101,11 +141,22 @@ def place_order(
         "tag": tag
     }
 
-    quantplay_client.place_order(order)
+    return {"order_id": get_client().place_order(order)}
+
+def use_uvloop() -> None:
+    """Switch asyncio to uvloop's event loop when it is installed (POSIX only)."""
+    if sys.platform == "win32":
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
 def main():
     print("Starting MCP server")
     """Run the MCP server"""
+    use_uvloop()
     mcp.run()
 
 if __name__ == "__main__":
@@ -0,0 +1,388 @@
+"""Tests for the QuantPlay API client."""
+import asyncio
+import json
+import socket
+import threading
+
+import aiohttp
+import pytest
+import requests
+from aiohttp import web
+
+from quantplay_mcp import client as client_module
+from quantplay_mcp.client import APIRequestError, QuantPlayClient, TimeoutError, _TTLCache
+from quantplay_mcp.config import (
+    ASYNC_CONNECTION_LIMIT_PER_HOST,
+    NEGATIVE_CACHE_MAXSIZE,
+    NEGATIVE_CACHE_TTL,
+    POSITIONS_CACHE_TTL,
+)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the cache's monotonic clock with one the test can advance."""
+    now = [1000.0]
+    monkeypatch.setattr(client_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """A client whose HTTP layer records calls instead of touching the network."""
+    quantplay_client = QuantPlayClient(api_key="test-key")
+    quantplay_client.requests = []
+
+    def fake_request(method, url, **kwargs):
+        quantplay_client.requests.append((method, url))
+        return [{"url": url, "call": len(quantplay_client.requests)}]
+
+    monkeypatch.setattr(quantplay_client, "_request", fake_request)
+    yield quantplay_client
+    quantplay_client.close()
+
+
+def test_repeat_call_is_served_from_cache(client, clock):
+    first = client.get_positions("alpha")
+    second = client.get_positions("alpha")
+
+    assert first == second
+    assert len(client.requests) == 1
+
+
+def test_entry_expires_after_ttl(client, clock):
+    client.get_positions("alpha")
+    clock[0] += POSITIONS_CACHE_TTL + 0.1
+    client.get_positions("alpha")
+
+    assert len(client.requests) == 2
+
+
+def test_keyword_and_positional_calls_share_an_entry(client, clock):
+    positional = client.get_positions("alpha")
+    keyword = client.get_positions(nickname="alpha")
+    holdings = client.get_holdings(nickname="alpha")
+
+    assert positional == keyword
+    assert len(client.requests) == 2
+    assert holdings[0]["url"].endswith("/accounts/alpha/holdings")
+
+
+def test_mutating_a_result_does_not_change_the_cache(client, clock):
+    client.get_positions("alpha").append("junk")
+
+    assert "junk" not in client.get_positions("alpha")
+    assert len(client.requests) == 1
+
+
+def test_invalidate_drops_only_that_account(client, clock):
+    client.get_positions("alpha")
+    client.get_holdings("alpha")
+    client.get_positions("beta")
+    client.get_accounts()
+
+    client.invalidate("alpha")
+    client.get_positions("alpha")
+    client.get_holdings("alpha")
+    client.get_positions("beta")
+    client.get_accounts()
+
+    assert len(client.requests) == 6
+
+
+def test_invalidate_without_nickname_drops_every_account(client, clock):
+    client.get_positions("alpha")
+    client.get_positions("beta")
+
+    client.invalidate()
+    client.get_positions("alpha")
+    client.get_positions("beta")
+
+    assert len(client.requests) == 4
+
+
+def test_async_context_manager_closes_both_sessions():
+    async def use_client():
+        async with QuantPlayClient(api_key="test-key") as quantplay_client:
+            aio_session = await quantplay_client._get_session()
+        return quantplay_client, aio_session
+
+    quantplay_client, aio_session = asyncio.run(use_client())
+
+    assert aio_session.closed
+    assert quantplay_client._aio_session is None
+    assert not quantplay_client._session.adapters["https://"].poolmanager.pools
+
+
+@pytest.fixture
+def silent_server():
+    """A local server that accepts connections but never answers; yields (url, accepted)."""
+    server_socket = socket.create_server(("127.0.0.1", 0), backlog=8)
+    accepted = []
+
+    def accept_forever():
+        while True:
+            try:
+                connection, _ = server_socket.accept()
+            except OSError:
+                return
+            accepted.append(connection)
+
+    threading.Thread(target=accept_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server_socket.getsockname()[1]}", accepted
+
+    server_socket.shutdown(socket.SHUT_RDWR)
+    server_socket.close()
+    for connection in accepted:
+        connection.close()
+
+
+@pytest.fixture
+def full_backlog_server():
+    """A local server whose accept queue is full, so new connections never complete."""
+    server_socket = socket.create_server(("127.0.0.1", 0), backlog=0)
+    filler = socket.create_connection(server_socket.getsockname())
+    yield f"http://127.0.0.1:{server_socket.getsockname()[1]}"
+
+    filler.close()
+    server_socket.close()
+
+
+def test_read_timeout_after_retries_is_reported_as_timeout(silent_server):
+    url, accepted = silent_server
+    quantplay_client = QuantPlayClient(
+        api_key="test-key", base_url=url, timeout=0.2, connect_timeout=1
+    )
+
+    with pytest.raises(TimeoutError, match="no data received for 0.2 seconds"):
+        quantplay_client.get_positions("alpha")
+
+    # The first attempt plus the adapter's two read retries
+    assert len(accepted) == 3
+
+
+def test_connect_timeout_is_reported_with_connect_timeout(full_backlog_server):
+    quantplay_client = QuantPlayClient(
+        api_key="test-key", base_url=full_backlog_server, timeout=30, connect_timeout=0.2
+    )
+
+    with pytest.raises(TimeoutError, match="after 0.2 seconds"):
+        quantplay_client.get_positions("alpha")
+
+
+@pytest.mark.parametrize(
+    ("error", "expected"),
+    [
+        (aiohttp.ConnectionTimeoutError(), "after 5 seconds"),
+        (aiohttp.SocketTimeoutError(), "for 30 seconds"),
+    ],
+)
+def test_async_timeout_reports_the_timeout_that_fired(monkeypatch, error, expected):
+    quantplay_client = QuantPlayClient(api_key="test-key", timeout=30, connect_timeout=5)
+
+    class TimingOutSession:
+        def get(self, url):
+            raise error
+
+    async def get_session():
+        return TimingOutSession()
+
+    monkeypatch.setattr(quantplay_client, "_get_session", get_session)
+
+    with pytest.raises(TimeoutError, match=expected):
+        asyncio.run(quantplay_client.async_get_positions("alpha"))
+
+
+def stub_async_positions(monkeypatch, quantplay_client, outcomes):
+    """Make async_get_positions return or raise the outcome given per nickname."""
+    async def fake_async_get_positions(nickname):
+        outcome = outcomes[nickname]
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+    monkeypatch.setattr(quantplay_client, "async_get_positions", fake_async_get_positions)
+
+
+def test_get_all_positions_reports_api_errors_per_account(monkeypatch):
+    quantplay_client = QuantPlayClient(api_key="test-key")
+    stub_async_positions(monkeypatch, quantplay_client, {
+        "alpha": [{"tradingsymbol": "INFY"}],
+        "beta": APIRequestError(404, "Account not found"),
+        "gamma": [],
+    })
+
+    result = asyncio.run(quantplay_client.get_all_positions(["alpha", "beta", "gamma"]))
+
+    assert result == {
+        "alpha": [{"tradingsymbol": "INFY"}],
+        "beta": {"error": "API request failed: 404 - Account not found"},
+        "gamma": [],
+    }
+
+
+def test_get_all_positions_reraises_unexpected_errors(monkeypatch):
+    quantplay_client = QuantPlayClient(api_key="test-key")
+    stub_async_positions(monkeypatch, quantplay_client, {
+        "alpha": [],
+        "beta": RuntimeError("boom"),
+    })
+
+    with pytest.raises(RuntimeError, match="boom"):
+        asyncio.run(quantplay_client.get_all_positions(["alpha", "beta"]))
+
+
+class FakeRaw:
+    """Stands in for urllib3's response stream."""
+
+    def __init__(self, body):
+        self._body = body
+
+    def read(self, decode_content=False):
+        return self._body
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def transport(monkeypatch):
+    """
+    A client whose session answers from ``transport.responder(method, url)``.
+
+    The responder returns ``(status_code, payload)``; every request is
+    recorded in ``transport.calls``.
+    """
+    quantplay_client = QuantPlayClient(api_key="test-key")
+
+    class Transport:
+        client = quantplay_client
+        calls = []
+        responder = None
+
+    def fake_request(method, url, **kwargs):
+        Transport.calls.append((method, url))
+        status_code, payload = Transport.responder(method, url)
+        response = requests.Response()
+        response.status_code = status_code
+        response.url = url
+        response.raw = FakeRaw(json.dumps(payload).encode())
+        return response
+
+    monkeypatch.setattr(quantplay_client._session, "request", fake_request)
+    yield Transport
+    quantplay_client.close()
+
+
+def test_repeated_404_is_served_from_negative_cache(transport, clock):
+    transport.responder = lambda method, url: (404, {"message": "Account not found"})
+
+    for _ in range(2):
+        with pytest.raises(APIRequestError) as excinfo:
+            transport.client.get_positions("ghost")
+        assert excinfo.value.status_code == 404
+        assert excinfo.value.message == "Account not found"
+    assert len(transport.calls) == 1
+
+    clock[0] += NEGATIVE_CACHE_TTL + 0.1
+    with pytest.raises(APIRequestError):
+        transport.client.get_positions("ghost")
+    assert len(transport.calls) == 2
+
+
+@pytest.mark.parametrize("status_code", [408, 429])
+def test_transient_4xx_is_not_negative_cached(transport, clock, status_code):
+    transport.responder = lambda method, url: (status_code, {"message": "Try again"})
+
+    for _ in range(2):
+        with pytest.raises(APIRequestError):
+            transport.client.get_positions("alpha")
+
+    assert len(transport.calls) == 2
+
+
+def test_post_errors_are_not_negative_cached(transport, clock):
+    transport.responder = lambda method, url: (400, {"message": "Invalid quantity"})
+    order = {"nickname": "alpha", "tradingsymbol": "INFY", "quantity": 0}
+
+    for _ in range(2):
+        with pytest.raises(APIRequestError):
+            transport.client.place_order(order)
+
+    assert [method for method, _ in transport.calls] == ["POST", "POST"]
+
+
+def test_place_order_clears_negative_cache_for_that_account(transport, clock):
+    transport.responder = lambda method, url: (404, {"message": "Account not found"})
+    for nickname in ("alpha", "beta"):
+        with pytest.raises(APIRequestError):
+            transport.client.get_positions(nickname)
+
+    transport.responder = lambda method, url: (
+        (200, {"error": False, "data": "230915000123456"}) if method == "POST"
+        else (200, {"error": False, "data": []})
+    )
+    transport.client.place_order({"nickname": "alpha"})
+
+    assert transport.client.get_positions("alpha") == []
+    with pytest.raises(APIRequestError):
+        transport.client.get_positions("beta")
+    assert len(transport.calls) == 4
+
+
+def test_negative_cache_evicts_oldest_entry_when_full(transport, clock):
+    transport.responder = lambda method, url: (404, {"message": "Account not found"})
+
+    for index in range(NEGATIVE_CACHE_MAXSIZE + 1):
+        with pytest.raises(APIRequestError):
+            transport.client.get_positions(f"ghost-{index}")
+    assert len(transport.calls) == NEGATIVE_CACHE_MAXSIZE + 1
+
+    # The newest entry is still cached, the oldest was evicted to make room
+    with pytest.raises(APIRequestError):
+        transport.client.get_positions(f"ghost-{NEGATIVE_CACHE_MAXSIZE}")
+    assert len(transport.calls) == NEGATIVE_CACHE_MAXSIZE + 1
+    with pytest.raises(APIRequestError):
+        transport.client.get_positions("ghost-0")
+    assert len(transport.calls) == NEGATIVE_CACHE_MAXSIZE + 2
+
+
+def test_ttl_cache_overwriting_a_key_does_not_evict(clock):
+    cache = _TTLCache(maxsize=2)
+    cache.set("a", 1, ttl=10)
+    cache.set("b", 2, ttl=10)
+    cache.set("b", 3, ttl=10)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") == 3
+
+
+def test_fan_out_beyond_per_host_limit_waits_for_a_pooled_connection():
+    nicknames = [f"acct-{index}" for index in range(ASYNC_CONNECTION_LIMIT_PER_HOST + 5)]
+
+    async def positions(request):
+        await asyncio.sleep(0.3)
+        return web.json_response({"error": False, "data": [request.match_info["nickname"]]})
+
+    async def fetch_all():
+        app = web.Application()
+        app.router.add_get("/accounts/{nickname}/positions", positions)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = runner.addresses[0][1]
+
+        # Requests past the per-host limit queue for longer than connect_timeout
+        quantplay_client = QuantPlayClient(
+            api_key="test-key", base_url=f"http://127.0.0.1:{port}", connect_timeout=0.1
+        )
+        try:
+            return await quantplay_client.get_all_positions(nicknames)
+        finally:
+            await quantplay_client.aclose()
+            await runner.cleanup()
+
+    result = asyncio.run(fetch_all())
+
+    assert result == {nickname: [nickname] for nickname in nicknames}
@@ -0,0 +1,46 @@
+"""Tests for the Quantplay MCP server tools."""
+import asyncio
+
+from quantplay_mcp import server
+from quantplay_mcp.client import APIRequestError, QuantPlayClient
+
+
+def test_get_all_positions_tool_fetches_every_account(monkeypatch):
+    quantplay_client = QuantPlayClient(api_key="test-key")
+
+    async def fake_async_get_accounts():
+        return [{"nickname": "alpha"}, {"nickname": "beta"}]
+
+    async def fake_async_get_positions(nickname):
+        if nickname == "beta":
+            raise APIRequestError(403, "Session expired")
+        return [{"tradingsymbol": "INFY"}]
+
+    monkeypatch.setattr(quantplay_client, "async_get_accounts", fake_async_get_accounts)
+    monkeypatch.setattr(quantplay_client, "async_get_positions", fake_async_get_positions)
+    monkeypatch.setattr(server, "get_client", lambda: quantplay_client)
+
+    result = asyncio.run(server.get_all_positions())
+
+    assert result == {
+        "alpha": [{"tradingsymbol": "INFY"}],
+        "beta": {"error": "API request failed: 403 - Session expired"},
+    }
+
+
+def test_place_order_tool_wraps_the_order_id(monkeypatch):
+    quantplay_client = QuantPlayClient(api_key="test-key")
+    placed = []
+
+    def fake_place_order(order):
+        placed.append(order)
+        return "230915000123456"
+
+    monkeypatch.setattr(quantplay_client, "place_order", fake_place_order)
+    monkeypatch.setattr(server, "get_client", lambda: quantplay_client)
+
+    result = server.place_order("alpha", "INFY", 1, "BUY")
+
+    assert result == {"order_id": "230915000123456"}
+    assert placed[0]["nickname"] == "alpha"
+    assert placed[0]["transaction_type"] == "BUY"